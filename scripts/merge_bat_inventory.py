@@ -10,6 +10,7 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+import orjson
 
 from utils import setup_logging, save_json_file, create_timestamp
 
@@ -20,8 +21,8 @@ def load_json_file(filename: str) -> Dict[str, Any]:
         print(f"File {filename} doesn't exist, starting with empty inventory")
         return {}
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
     except (json.JSONDecodeError, IOError) as e:
         print(f"Failed to load {filename}: {e}")
         return {}
@@ -11,6 +11,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import glob
+import orjson
 
 
 def setup_logging() -> logging.Logger:
@@ -28,8 +29,8 @@ def load_json_file(filename: str) -> Dict[str, Any]:
         return {}
     
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
     except (json.JSONDecodeError, IOError) as e:
         logging.error(f"Failed to load {filename}: {e}")
         return {}
@@ -38,8 +39,9 @@ def load_json_file(filename: str) -> Dict[str, Any]:
 def save_json_file(data: Dict[str, Any], filename: str) -> None:
     """Save data to JSON file with pretty formatting."""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        # Same layout as json.dump(indent=2, ensure_ascii=False, sort_keys=True)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
         logging.info(f"Successfully saved {filename}")
     except IOError as e:
         logging.error(f"Failed to save {filename}: {e}")
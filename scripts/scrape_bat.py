@@ -11,28 +11,431 @@ Bring a Trailer scraper for Porsche 911 listings (1981+).
 """
 
 import argparse
+import atexit
 import json
 import os
+import queue
 import re
+import sqlite3
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Iterator, Optional
 from urllib.parse import urljoin, urlparse, quote
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from bs4.dammit import UnicodeDammit
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from utils import setup_logging, save_json_file, create_timestamp, validate_vin
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from utils import setup_logging, save_json_with_records, iter_json_records, create_timestamp, validate_vin
+
+# Precompiled patterns for the per-link and per-listing hot paths
+_WP0_VIN_RE = re.compile(r'\bWP0[A-HJ-NPR-Z0-9]{14}\b', re.IGNORECASE)
+_VIN_CHARS_RE = re.compile(r'[A-HJ-NPR-Z0-9]{17}')
+_LISTING_PATH_RE = re.compile(r'^(198[1-9]|199\d|20[0-2]\d)-porsche-911-', re.IGNORECASE)  # 1981-2029 only
+_TITLE_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_PRICE_RE = re.compile(r'\$[\d,]+')
+# Bid, sold and mileage patterns are tried in priority order. Each search runs on
+# re's literal-prefix fast path; a single named-group alternation loses that and
+# measured 15-20x slower on a full page, besides returning the leftmost rather
+# than the highest-priority match.
+_BID_RES = tuple(re.compile(p) for p in (
+    r'usd\s*\$[\d,]+',  # "USD $149,582"
+    r'bid:\s*usd\s*\$[\d,]+',
+    r'current bid[:\s]*\$[\d,]+',
+    r'\$[\d,]+\s*current bid',
+    r'bid[:\s]*\$[\d,]+',
+))
+_SOLD_RES = tuple(re.compile(p) for p in (
+    r'sold for \$[\d,]+',
+    r'winning bid[:\s]*\$[\d,]+',
+    r'final bid[:\s]*\$[\d,]+',
+    r'hammer price[:\s]*\$[\d,]+',
+))
+
+# Listing pages are read with compiled lxml XPath; soupsieve CSS matching in pure Python
+# cost more CPU than fetching the page. Text nodes kept match BeautifulSoup's get_text():
+# nothing from scripts, styles, templates or ruby annotations
+_TEXT_NODES_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template or ancestor::rt or ancestor::rp)]',
+    smart_strings=False
+)
+_CSS_CLASS_TEST = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"  # CSS .name
+
+# BaT page sections that carry the chassis number and the auction summary
+# (the title is included because it carries the "No Reserve" prefix)
+_ESSENTIALS_XPATH = etree.XPath('//*[{}]'.format(' or '.join(  # .essentials, .listing-essentials, .item-essentials
+    _CSS_CLASS_TEST.format(name) for name in ('essentials', 'listing-essentials', 'item-essentials')
+)))
+_AUCTION_SUMMARY_XPATH = etree.XPath('//*[self::h1 or {}]'.format(' or '.join(  # h1, .listing-available-info, ...
+    _CSS_CLASS_TEST.format(name) for name in ('listing-available-info', 'listing-available', 'listing-stats')
+)))
+
+# Literal reserve flags reported alongside the price
+_RESERVE_MET_INDICATORS = ('reserve met', 'reserve has been met')
+_NO_RESERVE_INDICATORS = ('no reserve', 'no-reserve')
+
+# Auction status indicators, checked in priority order
+_SOLD_INDICATORS = (
+    'sold for usd $',  # "Sold for USD $56,000 on 9/25/24"
+    'sold for $',
+    'bid to usd $',    # "Bid to USD $211,500 on 9/1/25" (indicates completed auction)
+    'winning bid:',
+    'final bid:',
+    'hammer price:',
+    'sale completed',
+    'congratulations to',
+    'auction ended',
+    'sold on ',        # "sold on 10/30/2024"
+    'ended on ',       # "ended on 10/30/2024"
+)
+_ENDED_INDICATORS = (
+    'reserve not met',
+    'auction ended without sale',
+    'no sale',
+    'did not meet reserve',
+    'reserve was not met',
+    'unsuccessful auction',
+)
+_ACTIVE_INDICATORS = (
+    'current bid: usd $',  # "Current Bid: USD $48,755" (active auction)
+    'ends in',
+    'time left:',
+    'days left',
+    'hours left',
+    'minutes left',
+    'bidding ends',
+    'checking for last second bids',
+    'place bid',
+    'register to bid',
+    'bid now',
+    'reserve not yet met',  # This indicates active auction
+)
+# Date-bearing fallbacks, only consulted when no plain indicator matched
+_SOLD_DATE_RES = tuple(re.compile(p) for p in (
+    r'sold for usd \$[\d,]+ on \d{1,2}/\d{1,2}/\d{2,4}',     # "Sold for USD $56,000 on 9/25/24"
+    r'bid to usd \$[\d,]+ on \d{1,2}/\d{1,2}/\d{2,4}',      # "Bid to USD $211,500 on 9/1/25"
+    r'ended \d{1,2}/\d{1,2}/\d{2,4}',
+    r'sold on \d{1,2}/\d{1,2}/\d{2,4}',
+))
+_ACTIVE_BID_RE = re.compile(r'current bid:\s*usd \$[\d,]+')  # "Current Bid: USD $48,755"
+
+# Parsed dates earlier than this are misreads rather than BaT auction dates
+_EARLIEST_BAT_DATE = datetime(2020, 1, 1)
+
+# Date formats accepted by parse_bat_date_format, each gated by a shape check
+_BAT_DATE_FORMATS = tuple((fmt, re.compile(p)) for fmt, p in (
+    ('%m/%d/%y', r'\d{1,2}/\d{1,2}/\d{2}'),    # 9/18/25
+    ('%m/%d/%Y', r'\d{1,2}/\d{1,2}/\d{4}'),   # 9/18/2025
+    ('%b %d, %Y', r'\w{3} \d{1,2}, \d{4}'),   # Sep 18, 2025
+    ('%B %d, %Y', r'\w+ \d{1,2}, \d{4}'),     # September 18, 2025
+))
+
+# Completion dates on auction results cards
+_AUCTION_CARD_DATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'sold for usd \$[\d,]+ on (\d{1,2}/\d{1,2}/\d{2,4})',  # "Sold for USD $110,000 on 9/18/25"
+    r'bid to usd \$[\d,]+ on (\d{1,2}/\d{1,2}/\d{2,4})',   # "Bid to USD $146,000 on 9/17/25"
+    r'ended on (\d{1,2}/\d{1,2}/\d{2,4})',                   # "Ended on 9/18/25"
+    r'completed (\d{1,2}/\d{1,2}/\d{2,4})',                  # "Completed 9/18/25"
+    r'auction ended (\d{1,2}/\d{1,2}/\d{2,4})',              # "Auction ended 9/18/25"
+    r'(\d{1,2}/\d{1,2}/\d{2,4})\s*-\s*(?:sold|ended|completed)',  # "9/18/25 - Sold"
+))
+_ANY_BAT_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})')  # Any date in M/D/YY or M/D/YYYY format
+
+# Auction end dates on individual listing pages, paired with their strptime format
+_END_DATE_PATTERNS = tuple((re.compile(p, re.IGNORECASE), fmt) for p, fmt in (
+    # Past tense - for sold/ended auctions
+    (r'ended\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "ended September 16, 2024"
+    (r'auction ended on\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "auction ended on September 16, 2024"
+    (r'sold\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "sold September 16, 2024"
+
+    # Future tense - for active auctions
+    (r'ends on\s+(\w+,\s+\w+\s+\d{1,2})', '%A, %B %d'),  # "ends on Thursday, July 17" (current year assumed)
+    (r'ends\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "ends September 16, 2024"
+    (r'(\w+\s+\d{1,2},\s+\d{4})\s+at\s+\d', '%B %d, %Y'),  # "July 17, 2025 at 2:47PM"
+
+    # Short formats
+    (r'(\w{3}\s+\d{1,2},\s+\d{4})', '%b %d, %Y'),  # "Sep 16, 2024"
+    (r'(\d{4}-\d{2}-\d{2})', '%Y-%m-%d'),  # "2024-09-16"
+    (r'(\d{1,2}/\d{1,2}/\d{2,4})', None),  # "9/18/25" - use our custom parser
+
+    # Relative dates
+    (r'ended\s+(\d+)\s*days?\s*ago', None),  # "ended 5 days ago"
+    (r'sold\s+(\d+)\s*days?\s*ago', None),  # "sold 3 days ago"
+))
+
+# Listing-page detail extraction
+_MILEAGE_RES = tuple(re.compile(p) for p in (
+    r'(\d{1,3}(?:,\d{3})*)\s*(?:mile|mi\b)',
+    r'showing\s*(\d{1,3}(?:,\d{3})*)',
+    r'odometer[:\s]+(\d{1,3}(?:,\d{3})*)',
+))
+_ENGINE_RES = tuple(re.compile(p) for p in (
+    r'(\d\.\d)\s*(?:l|liter)',
+    r'(\d,?\d{3})\s*cc',
+))
+# Spec and equipment keywords, matched with plain substring scans of the lowercased page
+_MANUAL_KEYWORDS = ('manual', 'stick', '5-speed', '6-speed')
+_AUTOMATIC_KEYWORDS = ('automatic', 'tiptronic', 'pdk')
+_AWD_KEYWORDS = ('carrera 4', 'c4', 'awd', 'all-wheel')
+# Features must match whole words ('led' is inside "installed" and "detailed"); the
+# substring check runs first so the regex only scans pages that can match
+_FEATURE_KEYWORDS = tuple((keyword, keyword.title(), re.compile(rf'\b{re.escape(keyword)}\b')) for keyword in (
+    'sport chrono', 'pasm', 'pdls', 'pccb', 'sport exhaust',
+    'sunroof', 'navigation', 'heated seats', 'air conditioning',
+    'leather', 'alcantara', 'bose', 'xenon', 'led'
+))
+_LOCATION_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'located in ([^,\n.]+(?:,\s*[A-Z]{2})?)',  # "Located in City, ST"
+    r'seller[:\s]+[^,\n]+[,\s]+([^,\n.]+(?:,\s*[A-Z]{2})?)',  # "Seller: Name, Location"
+    r'(?:from|in)\s+([A-Z][a-z]+(?:,\s*[A-Z]{2})?)',  # "from/in Location"
+))
+
+# Text blocks that are error messages or navigation rather than a description
+_DESCRIPTION_SKIP_RES = tuple(re.compile(p) for p in (
+    r'please address the errors below',
+    r'view all listings',
+    r'notify me about new listings',
+    r'get this.*delivered with bring a trailer',
+    r'transparent pricing',
+    r'real time tracking',
+    r'easy and secure',
+    r'learn more',
+    r'sign in',
+    r'register',
+    r'search',
+    r'filter',
+    r'sort by',
+    r'show more',
+    r'load more',
+))
+
+# Description candidates tried in order: (XPaths in priority order, minimum length,
+# keywords of which one must appear)
+_DESCRIPTION_APPROACHES = tuple(
+    (tuple(etree.XPath(path) for path in paths), min_length, must_contain)
+    for paths, min_length, must_contain in (
+        # Approach 1: Look for specific BaT description containers
+        (('//div[contains(@class, "listing-description")]',
+          '//div[contains(@class, "auction-description")]',
+          '//div[contains(@class, "description")]'), 50, None),
+        # Approach 2: Look for paragraphs with meaningful content
+        (('//div[{}]//p'.format(_CSS_CLASS_TEST.format('listing-content')),
+          '//div[{}]//p'.format(_CSS_CLASS_TEST.format('auction-content')),
+          '//main//p'), 30, None),
+        # Approach 3: Look for text blocks that contain car-specific keywords
+        (('//div', '//section', '//article'), 100,
+         ('powered by', 'engine', 'transmission', 'miles', 'purchased', 'equipped', 'features')),
+    )
+)
+
+# Elements that may name the seller's location, in priority order
+_LOCATION_XPATHS = tuple(
+    etree.XPath(f'//{tag}[contains(@class, "{name}")]')
+    for name in ('location', 'seller') for tag in ('span', 'div')
+)
+
+_LISTING_LINK_CSS = 'a[href*="/listing/"]'
+
+# Read every listing href in one script round trip instead of one get_attribute call per link
+_LISTING_HREFS_JS = f"return Array.from(document.querySelectorAll('{_LISTING_LINK_CSS}'), a => a.href);"
+
+# Rendered text of the first N (arguments[0]) elements holding text; unrendered ones
+# (head, scripts, display:none) give '' like Selenium's element.text
+_ELEMENT_TEXTS_JS = """
+const snapshot = document.evaluate('//*[text()]', document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const texts = [];
+for (let i = 0; i < Math.min(snapshot.snapshotLength, arguments[0]); i++) {
+    const el = snapshot.snapshotItem(i);
+    texts.push(el.getClientRects().length ? el.innerText : '');
+}
+return texts;
+"""
+
+# The last N (arguments[0]) M/D/YY dates in the page markup, same as _ANY_BAT_DATE_RE over page_source
+_PAGE_DATES_JS = (
+    "return (document.documentElement.outerHTML.match(/\\d{1,2}\\/\\d{1,2}\\/\\d{2,4}/g) || [])"
+    ".slice(-arguments[0]);"
+)
+
+# Resource types and third-party trackers the browser never needs to download for scraping.
+# Stylesheets stay: the Show More lookup relies on layout to skip hidden controls
+_BLOCKED_RESOURCE_URLS = (
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*', '*connect.facebook.net*',
+)
+
+# Markers of a bot-check interstitial served in place of the listing
+_CHALLENGE_MARKERS = (b'<title>Just a moment...</title>', b'cf_chl_opt')
+
+# BaT's own pagination controls; matched by class before falling back to text-search XPath
+_SHOW_MORE_CSS = 'button.auctions-footer-button, a.auctions-footer-button, [data-bind*="showMore"]'
+_SHOW_MORE_XPATH = "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]"
+
+# Every text, class and id variant of a pagination control, in priority order: text
+# matches first so a .show-more wrapper never wins over the button inside it
+_LOWERCASE_TEXT = "translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_SHOW_MORE_ANY_XPATHS = (
+    "//*[contains(text(), 'Show More')]",
+    "//*[contains(text(), 'Load More')]",
+    "//*[contains(text(), 'See More')]",
+    "//*[contains(text(), 'View More')]",
+    f"//*[contains({_LOWERCASE_TEXT}, 'show more')]",
+    f"//*[contains({_LOWERCASE_TEXT}, 'load more')]",
+    "//*[contains(@class, 'show-more')]",
+    "//*[contains(@class, 'load-more')]",
+    "//*[contains(@class, 'more-results')]",
+    "//*[contains(@id, 'show-more')]",
+    "//*[contains(@id, 'load-more')]",
+)
+
+# Returns [element, tag, text] for the first visible, enabled candidate with text; CSS
+# matches (arguments[0]) take priority over XPath matches (arguments[1], tried in order)
+_FIND_SHOW_MORE_JS = """
+const candidates = Array.from(document.querySelectorAll(arguments[0]));
+for (const xpath of arguments[1]) {
+    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        candidates.push(snapshot.snapshotItem(i));
+    }
+}
+for (const el of candidates) {
+    const text = (el.innerText || '').trim();
+    // Rendered and not hidden; unlike offsetParent this keeps position: fixed/sticky bars
+    const visible = el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    if (visible && !el.disabled && text) {
+        return [el, el.tagName.toLowerCase(), text];
+    }
+}
+return null;
+"""
+
+
+# The same VINs recur across comments and related-listing widgets; validation is pure
+_is_valid_vin = lru_cache(maxsize=8192)(validate_vin)
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\b notion of a word character."""
+    return char.isalnum() or char == '_'
+
+
+def _parse_html(page_source) -> lxml.html.HtmlElement:
+    """Parse page markup with lxml, decoding bytes the same way BeautifulSoup does."""
+    if isinstance(page_source, bytes):
+        page_source = UnicodeDammit(page_source, is_html=True).unicode_markup
+    return lxml.html.document_fromstring(page_source)
+
+
+def _element_text(element: lxml.html.HtmlElement, separator: str = '') -> str:
+    """Join an element's stripped text pieces, like BeautifulSoup's get_text(separator, strip=True)."""
+    return separator.join(text for text in (node.strip() for node in _TEXT_NODES_XPATH(element)) if text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str, fmt: str) -> datetime:
+    """
+    datetime.strptime, memoized since results pages re-show the same dates after every click.
+    ISO dates go through the C-implemented fromisoformat instead.
+    """
+    if fmt == '%Y-%m-%d':
+        return datetime.fromisoformat(date_str)
+    return datetime.strptime(date_str, fmt)
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces request starts by an interval.
+    The interval widens while the server pushes back and eases back to min_interval.
+    """
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 30.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def slow_down(self) -> None:
+        """Double the interval after the server throttles or fails a request."""
+        with self._lock:
+            self.interval = min(max(self.interval, 0.5) * 2, self.max_interval)
+
+    def speed_up(self) -> None:
+        """Ease the interval back toward min_interval after a successful request."""
+        if self.interval > self.min_interval:
+            with self._lock:
+                self.interval = max(self.min_interval, self.interval * 0.9)
+
+
+class ListingCache:
+    """SQLite record of scraped listings, kept across runs to skip finished auctions."""
+
+    FINAL_STATUSES = ('sold', 'ended')
+
+    def __init__(self, db_path: str = 'bat_cache.sqlite'):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS listings ('
+                'listing_id TEXT PRIMARY KEY, vin TEXT, status TEXT, scraped_at TEXT)'
+            )
+
+    def final_listing_ids(self) -> set:
+        """Return ids of listings whose auction has already finished."""
+        placeholders = ', '.join('?' for _ in self.FINAL_STATUSES)
+        with self._lock:
+            rows = self._db.execute(
+                f'SELECT listing_id FROM listings WHERE status IN ({placeholders})',
+                self.FINAL_STATUSES
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def record(self, listing_id: str, vin: str, status: str, scraped_at: str) -> None:
+        """Insert or refresh a scraped listing."""
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT INTO listings (listing_id, vin, status, scraped_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(listing_id) DO UPDATE SET '
+                'vin = excluded.vin, status = excluded.status, scraped_at = excluded.scraped_at',
+                (listing_id, vin, status, scraped_at)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
 
 class BaTScraper:
     """Bring a Trailer scraper for Porsche 911 listings."""
 
-    def __init__(self, max_runtime_minutes: int = 45, max_listings: Optional[int] = None):
+    def __init__(self, max_runtime_minutes: int = 45, max_listings: Optional[int] = None,
+                 request_interval: float = 1.0, cache_path: Optional[str] = 'bat_cache.sqlite',
+                 max_workers: int = 4):
         self.logger = setup_logging()
         self.base_url = "https://bringatrailer.com"
         self.max_runtime = timedelta(minutes=max_runtime_minutes)
@@ -42,7 +445,38 @@ class BaTScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36'
         })
+
+        # Keep-alive pool shared by the listing workers, with backoff on transient errors;
+        # sized so every worker plus the discovery thread can hold a connection
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(20, max_workers + 1), max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.processed_vins = set()
+        self._vins_lock = threading.Lock()
+
+        # Discovery phases run one after another and share a single Chrome
+        self._discovery_driver = None
+
+        # Each listing worker thread keeps one Chrome for its lifetime
+        self._worker_local = threading.local()
+        self._worker_drivers = []
+        self._worker_drivers_lock = threading.Lock()
+
+        # chromedriver path resolved by Selenium Manager on the first launch
+        self._chromedriver_path = None
+
+        # Set once the scrape loop is done so discovery stops paginating
+        self.stop_event = threading.Event()
+
+        # Safety net for browsers still open if the process exits early
+        atexit.register(self.close)
+
+        # Listing workers share one limiter so concurrency stays polite to BaT
+        self.rate_limiter = RateLimiter(request_interval)
+
+        # Finished auctions never change, so repeat runs can skip them entirely
+        self.cache = ListingCache(cache_path) if cache_path else None
         
         # Set cutoff date to 3 months ago from today (90 days)
         self.cutoff_date = datetime.now() - timedelta(days=90)
@@ -51,10 +485,11 @@ class BaTScraper:
         if self.max_listings:
             self.logger.info(f"Maximum listings to collect: {self.max_listings}")
 
-    def configure_chrome_driver(self) -> webdriver.Chrome:
-        """Configure Chrome driver for BaT scraping."""
+    @cached_property
+    def _chrome_options(self) -> Options:
+        """Chrome options shared by every driver this scraper starts."""
         chrome_options = Options()
-        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
@@ -63,14 +498,133 @@ class BaTScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
+
+        # Photo URLs are read from <img> attributes, so the image bytes are never needed
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+
+        # Skip browser housekeeping traffic that has nothing to do with the page
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-features=TranslateUI")
+        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
+        chrome_options.add_argument("--disable-breakpad")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--hide-scrollbars")
+
+        # Headless tabs count as backgrounded; keep their timers and rendering at full speed
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-ipc-flooding-protection")
+
+        # Every navigation is followed by an explicit wait for the elements it needs,
+        # so driver.get can return at DOMContentLoaded instead of the full load event
+        chrome_options.page_load_strategy = 'eager'
+        return chrome_options
+
+    def configure_chrome_driver(self) -> webdriver.Chrome:
+        """Configure Chrome driver for BaT scraping."""
+        # Later launches reuse the resolved chromedriver instead of running
+        # Selenium Manager's lookup again
+        service = Service(executable_path=self._chromedriver_path) if self._chromedriver_path else None
+        driver = webdriver.Chrome(options=self._chrome_options, service=service)
+        self._chromedriver_path = driver.service.path
+
+        # Registered once, applied by Chrome to every page the driver navigates to
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        })
+
+        # Fonts and video are never read; block them at the network layer
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_RESOURCE_URLS)})
+
+        return driver
+
+    def discovery_driver(self) -> webdriver.Chrome:
+        """Return the Chrome driver shared by the discovery phases, starting it on first use."""
+        if self._discovery_driver is None:
+            self._discovery_driver = self.configure_chrome_driver()
+        return self._discovery_driver
+
+    def discard_discovery_driver(self) -> None:
+        """Quit the discovery driver so the next phase starts a fresh one."""
+        driver, self._discovery_driver = self._discovery_driver, None
+        if driver:
+            try:
+                driver.quit()
+            except:
+                pass
+
+    def worker_driver(self) -> webdriver.Chrome:
+        """Return the calling thread's Chrome driver, starting it on first use."""
+        driver = getattr(self._worker_local, 'driver', None)
+        if driver is None:
+            driver = self.configure_chrome_driver()
+            self._worker_local.driver = driver
+            with self._worker_drivers_lock:
+                self._worker_drivers.append(driver)
         return driver
 
+    def discard_worker_driver(self) -> None:
+        """Quit the calling thread's driver so the next listing starts a fresh one."""
+        driver = getattr(self._worker_local, 'driver', None)
+        if driver is None:
+            return
+
+        self._worker_local.driver = None
+        with self._worker_drivers_lock:
+            self._worker_drivers.remove(driver)
+        try:
+            driver.quit()
+        except:
+            pass
+
+    def close_worker_drivers(self) -> None:
+        """Quit every listing worker's driver."""
+        with self._worker_drivers_lock:
+            drivers, self._worker_drivers = self._worker_drivers, []
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+
+    def close(self) -> None:
+        """Quit every browser this scraper started. Safe to call more than once."""
+        self.discard_discovery_driver()
+        self.close_worker_drivers()
+
+    def find_show_more_button(self, driver: webdriver.Chrome, fallback_xpaths: tuple) -> Optional[list]:
+        """Return [element, tag, text] for the first clickable pagination control, or None."""
+        try:
+            return driver.execute_script(_FIND_SHOW_MORE_JS, _SHOW_MORE_CSS, list(fallback_xpaths))
+        except WebDriverException as e:
+            self.logger.debug(f"Error locating Show More button: {e}")
+            return None
+
+    def wait_for_listing_links(self, driver: webdriver.Chrome, more_than: int = 0,
+                               timeout: float = 10) -> bool:
+        """Wait until the page shows more than `more_than` listing links; False on timeout."""
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, _LISTING_LINK_CSS)) > more_than
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def should_continue(self, current_scraped_count: int = 0) -> bool:
         """Check if scraping should continue based on time limit and listing count."""
+        if self.stop_event.is_set():
+            return False
+
         elapsed = datetime.now() - self.start_time
         time_exceeded = elapsed >= self.max_runtime
         
@@ -80,21 +634,18 @@ class BaTScraper:
         
         return not time_exceeded
 
-    def parse_bat_date_format(self, date_str: str) -> Optional[datetime]:
-        """Parse BaT-specific date formats like '9/18/25' or '9/17/25'."""
+    def parse_bat_date_format(self, date_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Parse BaT-specific date formats like '9/18/25' or '9/17/25'.
+        Callers parsing many dates pass one `now` instead of reading the clock per date.
+        """
         try:
             # Handle formats like "9/18/25", "09/18/25", "9/18/2025"
-            date_patterns = [
-                ('%m/%d/%y', r'\d{1,2}/\d{1,2}/\d{2}'),    # 9/18/25
-                ('%m/%d/%Y', r'\d{1,2}/\d{1,2}/\d{4}'),   # 9/18/2025
-                ('%b %d, %Y', r'\w{3} \d{1,2}, \d{4}'),   # Sep 18, 2025
-                ('%B %d, %Y', r'\w+ \d{1,2}, \d{4}'),     # September 18, 2025
-            ]
-
-            for fmt, pattern in date_patterns:
-                if re.match(pattern, date_str.strip()):
+            date_str = date_str.strip()
+            for fmt, pattern in _BAT_DATE_FORMATS:
+                if pattern.match(date_str):
                     try:
-                        parsed_date = datetime.strptime(date_str.strip(), fmt)
+                        parsed_date = _parse_date(date_str, fmt)
                         
                         # Handle 2-digit year (assume 20xx if <= current year, otherwise 19xx)
                         if parsed_date.year <= 30:  # Assuming anything <= 2030 is 20xx
@@ -103,8 +654,9 @@ class BaTScraper:
                             parsed_date = parsed_date.replace(year=parsed_date.year + 2000)
                         
                         # Only return reasonable dates (not too far in future, not too old)
-                        now = datetime.now()
-                        if datetime(2020, 1, 1) <= parsed_date <= now + timedelta(days=30):
+                        if now is None:
+                            now = datetime.now()
+                        if _EARLIEST_BAT_DATE <= parsed_date <= now + timedelta(days=30):
                             return parsed_date
                     
                     except ValueError:
@@ -123,31 +675,26 @@ class BaTScraper:
             dates_found = []
             now = datetime.now()
 
-            # Look for all text elements on the page
-            all_text_elements = driver.find_elements(By.XPATH, "//*[text()]")
-
-            # Specific patterns for BaT auction results cards
-            auction_card_patterns = [
-                r'sold for usd \$[\d,]+ on (\d{1,2}/\d{1,2}/\d{2,4})',  # "Sold for USD $110,000 on 9/18/25"
-                r'bid to usd \$[\d,]+ on (\d{1,2}/\d{1,2}/\d{2,4})',   # "Bid to USD $146,000 on 9/17/25"
-                r'ended on (\d{1,2}/\d{1,2}/\d{2,4})',                   # "Ended on 9/18/25"
-                r'completed (\d{1,2}/\d{1,2}/\d{2,4})',                  # "Completed 9/18/25"
-                r'auction ended (\d{1,2}/\d{1,2}/\d{2,4})',              # "Auction ended 9/18/25"
-                r'(\d{1,2}/\d{1,2}/\d{2,4})\s*-\s*(?:sold|ended|completed)',  # "9/18/25 - Sold"
-            ]
+            # Read the first 100 text elements in one script call rather than one driver
+            # round-trip per element
+            element_texts = driver.execute_script(_ELEMENT_TEXTS_JS, 100)
 
             # Search through page text for auction completion patterns
-            for element in all_text_elements[:100]:  # Limit to first 100 elements
+            for text in element_texts:
                 try:
-                    element_text = element.text.strip().lower()
+                    element_text = (text or '').strip().lower()
                     if not element_text or len(element_text) > 300:  # Skip empty or very long text
                         continue
 
+                    # Every card pattern captures an M/D/YY date; one scan rules most text out
+                    if not _ANY_BAT_DATE_RE.search(element_text):
+                        continue
+
                     # Look for auction card patterns
-                    for pattern in auction_card_patterns:
-                        matches = re.findall(pattern, element_text, re.IGNORECASE)
+                    for pattern in _AUCTION_CARD_DATE_RES:
+                        matches = pattern.findall(element_text)
                         for match in matches:
-                            date_obj = self.parse_bat_date_format(match)
+                            date_obj = self.parse_bat_date_format(match, now)
                             if date_obj:
                                 dates_found.append(date_obj)
                                 self.logger.debug(f"Found auction completion date: '{match}' -> {date_obj.strftime('%Y-%m-%d')} from text: '{element_text[:100]}'")
@@ -156,21 +703,17 @@ class BaTScraper:
                     self.logger.debug(f"Error processing element text: {e}")
                     continue
 
-            # Also look for dates in more general patterns on the page
-            page_source = driver.page_source.lower()
-            general_patterns = [
-                r'(\d{1,2}/\d{1,2}/\d{2,4})',  # Any date in M/D/YY or M/D/YYYY format
-            ]
-
-            for pattern in general_patterns:
-                matches = re.findall(pattern, page_source)
-                for match in matches[-50:]:  # Take last 50 matches to avoid too much processing
-                    date_obj = self.parse_bat_date_format(match)
-                    if date_obj:
-                        # Only add if it's a reasonable auction date (within last 2 years)
-                        if date_obj >= datetime(2023, 1, 1):
-                            dates_found.append(date_obj)
-                            self.logger.debug(f"Found general date: '{match}' -> {date_obj.strftime('%Y-%m-%d')}")
+            # Also look for dates in more general patterns on the page. The match runs in
+            # the browser so the whole (growing) DOM isn't serialized back after every click
+            matches = driver.execute_script(_PAGE_DATES_JS, 50)
+            # Take last 50 matches to avoid too much processing; cards repeat dates, so parse each once
+            for match in dict.fromkeys(matches):
+                date_obj = self.parse_bat_date_format(match, now)
+                if date_obj:
+                    # Only add if it's a reasonable auction date (within last 2 years)
+                    if date_obj >= datetime(2023, 1, 1):
+                        dates_found.append(date_obj)
+                        self.logger.debug(f"Found general date: '{match}' -> {date_obj.strftime('%Y-%m-%d')}")
 
             # Remove duplicates and sort by most recent first
             unique_dates = list(set(dates_found))
@@ -185,8 +728,8 @@ class BaTScraper:
             avg_days_ago = sum(days_ago_list) / len(days_ago_list)
 
             # Count recent vs old based on our 3-month cutoff (90 days)
-            recent_count = sum(1 for days in days_ago_list if days <= 90)
             old_count = sum(1 for days in days_ago_list if days > 90)
+            recent_count = len(days_ago_list) - old_count
 
             # Consider page mostly old if more than 70% of auctions are older than 3 months
             is_mostly_old = (old_count / len(days_ago_list)) > 0.7 if len(days_ago_list) > 0 else False
@@ -217,51 +760,36 @@ class BaTScraper:
             self.logger.warning(f"Error analyzing auction completion dates: {e}")
             return {'is_mostly_old': False, 'recent_count': 1, 'old_count': 0, 'avg_days_ago': 45}
 
-    def extract_auction_end_date(self, page_text: str, listing_url: str) -> Optional[datetime]:
+    def extract_auction_end_date(self, page_text: str, listing_url: str,
+                                 text_lower: Optional[str] = None) -> Optional[datetime]:
         """Extract auction end date from individual listing page text."""
-        # Common date patterns on BaT individual listing pages
-        date_patterns = [
-            # Past tense - for sold/ended auctions
-            (r'ended\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "ended September 16, 2024"
-            (r'auction ended on\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "auction ended on September 16, 2024"
-            (r'sold\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "sold September 16, 2024"
-            
-            # Future tense - for active auctions
-            (r'ends on\s+(\w+,\s+\w+\s+\d{1,2})', '%A, %B %d'),  # "ends on Thursday, July 17" (current year assumed)
-            (r'ends\s+(\w+\s+\d{1,2},\s+\d{4})', '%B %d, %Y'),  # "ends September 16, 2024"
-            (r'(\w+\s+\d{1,2},\s+\d{4})\s+at\s+\d', '%B %d, %Y'),  # "July 17, 2025 at 2:47PM"
-            
-            # Short formats
-            (r'(\w{3}\s+\d{1,2},\s+\d{4})', '%b %d, %Y'),  # "Sep 16, 2024"
-            (r'(\d{4}-\d{2}-\d{2})', '%Y-%m-%d'),  # "2024-09-16"
-            (r'(\d{1,2}/\d{1,2}/\d{2,4})', None),  # "9/18/25" - use our custom parser
-            
-            # Relative dates
-            (r'ended\s+(\d+)\s*days?\s*ago', None),  # "ended 5 days ago"
-            (r'sold\s+(\d+)\s*days?\s*ago', None),  # "sold 3 days ago"
-        ]
+        if text_lower is None:
+            text_lower = page_text.lower()
 
-        text_lower = page_text.lower()
+        # One clock reading serves every candidate date on the page
+        now = datetime.now()
+        latest_date = now + timedelta(days=365)
 
-        for pattern, date_format in date_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
+        # finditer stops scanning at the first usable date instead of collecting every match
+        for pattern, date_format in _END_DATE_PATTERNS:
+            for found in pattern.finditer(text_lower):
+                match = found.group(1)
                 try:
                     if date_format is None:  # Special handling
-                        if 'days ago' in pattern:  # Relative date
+                        if 'days ago' in pattern.pattern:  # Relative date
                             days_ago = int(match)
-                            return datetime.now() - timedelta(days=days_ago)
+                            return now - timedelta(days=days_ago)
                         else:  # BaT date format like "9/18/25"
-                            return self.parse_bat_date_format(match)
+                            return self.parse_bat_date_format(match, now)
                     else:  # Absolute date
                         if date_format == '%A, %B %d':  # Add current year for partial dates
-                            match = f"{match} {datetime.now().year}"
+                            match = f"{match} {now.year}"
                             date_format = '%A, %B %d %Y'
 
-                        date_obj = datetime.strptime(match.strip(), date_format)
+                        date_obj = _parse_date(match.strip(), date_format)
                         
                         # Only return dates that make sense (not too far in future, not too old)
-                        if datetime(2020, 1, 1) <= date_obj <= datetime.now() + timedelta(days=365):
+                        if _EARLIEST_BAT_DATE <= date_obj <= latest_date:
                             return date_obj
 
                 except ValueError as e:
@@ -273,10 +801,9 @@ class BaTScraper:
 
         return None
 
-    def is_listing_too_old(self, page_text: str, listing_url: str, auction_status: str) -> bool:
-        """Check if any listing (active, sold, or ended) is older than 3 months."""
-        auction_date = self.extract_auction_end_date(page_text, listing_url)
-
+    def is_auction_date_too_old(self, auction_date: Optional[datetime], listing_url: str,
+                                auction_status: str) -> bool:
+        """Check an already-extracted auction end date against the 3 month cutoff."""
         if auction_date:
             is_too_old = auction_date < self.cutoff_date
             if is_too_old:
@@ -290,51 +817,48 @@ class BaTScraper:
         # If we can't determine the date for sold/ended listings, be conservative and include it
         return False
 
-    def search_auction_results(self) -> List[str]:
+    def search_auction_results(self) -> Iterator[str]:
         """
         Search the auction results page for Porsche 911 listings with date-based early stopping.
         Stops when it detects we're getting into pages with auctions older than 3 months.
+        Yields new listing URLs as each results page is collected.
         """
         self.logger.info("Searching auction results for recent Porsche 911 data (past 3 months by auction completion date)")
         listing_urls = set()
-        driver = None
+        seen_hrefs = set()
 
         try:
-            driver = self.configure_chrome_driver()
+            driver = self.discovery_driver()
 
             # Go to auction results with Porsche search
             search_url = f"{self.base_url}/auctions/results/?search=porsche+911"
             self.logger.info(f"Loading auction results search: {search_url}")
             driver.get(search_url)
 
-            # Wait for page to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)  # Reduced from 5
+            # Wait for the results grid rather than a fixed delay
+            self.wait_for_listing_links(driver, timeout=15)
 
             def collect_results_page():
                 """Collect all listing URLs from current results page."""
-                current_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/listing/"]')
                 new_urls_this_page = []
 
-                for link in current_links:
-                    try:
-                        href = link.get_attribute('href')
-                        if href and self.is_valid_listing_url(href):
-                            if href not in listing_urls:
-                                listing_urls.add(href)
-                                new_urls_this_page.append(href)
-                                self.logger.info(f"DEBUG: Added auction result: {href}")
-                    except Exception as e:
-                        self.logger.debug(f"Error processing results link: {e}")
+                for href in driver.execute_script(_LISTING_HREFS_JS):
+                    # Earlier cards are still on the page after each click; only
+                    # validate links not seen on a previous pass
+                    if href in seen_hrefs:
                         continue
+                    seen_hrefs.add(href)
+                    if href and self.is_valid_listing_url(href):
+                        listing_urls.add(href)
+                        new_urls_this_page.append(href)
+                        self.logger.info(f"DEBUG: Added auction result: {href}")
 
                 return new_urls_this_page
 
             # Collect initial results
             initial_urls = collect_results_page()
             self.logger.info(f"Initial auction results collection: {len(initial_urls)} valid listings")
+            yield from initial_urls
 
             # Enhanced pagination with auction-date-based early stopping
             page_clicks = 0
@@ -347,58 +871,11 @@ class BaTScraper:
             while (page_clicks < max_pages and consecutive_fails < max_consecutive_fails and
                    consecutive_old_pages < max_consecutive_old_pages and self.should_continue()):
                 try:
-                    # Multiple strategies to find Show More buttons
-                    show_more_selectors = [
-                        "//*[contains(text(), 'Show More')]",
-                        "//*[contains(text(), 'Load More')]",
-                        "//*[contains(text(), 'See More')]",
-                        "//*[contains(text(), 'View More')]",
-                        "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]",
-                        "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'load more')]",
-                        "//button[contains(text(), 'Show More')]",
-                        "//button[contains(text(), 'Load More')]",
-                        "//a[contains(text(), 'Show More')]",
-                        "//a[contains(text(), 'Load More')]",
-                        "//*[contains(@class, 'show-more')]",
-                        "//*[contains(@class, 'load-more')]",
-                        "//*[contains(@class, 'more-results')]",
-                        "//*[contains(@id, 'show-more')]",
-                        "//*[contains(@id, 'load-more')]"
-                    ]
-
-                    clickable_button = None
-                    button_info = ""
-
-                    # Try each selector until we find a clickable button
-                    for selector in show_more_selectors:
-                        try:
-                            buttons = driver.find_elements(By.XPATH, selector)
-                            self.logger.info(f"DEBUG: Selector '{selector}' found {len(buttons)} elements")
-
-                            for i, button in enumerate(buttons):
-                                try:
-                                    button_text = button.text.strip()
-                                    tag_name = button.tag_name
-                                    is_displayed = button.is_displayed()
-                                    is_enabled = button.is_enabled()
-
-                                    self.logger.info(f"DEBUG: Button {i+1}: <{tag_name}> '{button_text}' - Displayed: {is_displayed}, Enabled: {is_enabled}")
-
-                                    if is_displayed and is_enabled and button_text:
-                                        clickable_button = button
-                                        button_info = f"<{tag_name}> '{button_text}' via selector: {selector}"
-                                        break
-
-                                except Exception as e:
-                                    self.logger.debug(f"Error checking button {i+1}: {e}")
-                                    continue
-
-                            if clickable_button:
-                                break
-
-                        except Exception as e:
-                            self.logger.debug(f"Error with selector '{selector}': {e}")
-                            continue
+                    # One script call finds the first usable button instead of probing
+                    # text/tag/visibility/enabled state per candidate over the wire
+                    found = self.find_show_more_button(driver, _SHOW_MORE_ANY_XPATHS)
+                    clickable_button = found[0] if found else None
+                    button_info = f"<{found[1]}> '{found[2]}'" if found else ""
 
                     if not clickable_button:
                         self.logger.info("No more clickable Show More buttons found - exhausted pagination")
@@ -406,26 +883,20 @@ class BaTScraper:
 
                     # Record counts before clicking
                     pre_click_count = len(listing_urls)
+                    pre_click_links = len(driver.find_elements(By.CSS_SELECTOR, _LISTING_LINK_CSS))
                     self.logger.info(f"DEBUG: Clicking pagination button #{page_clicks + 1}: {button_info}")
 
                     # Enhanced clicking with multiple attempts
                     click_successful = False
                     for attempt in range(3):
                         try:
-                            # Scroll button into view
-                            driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", clickable_button)
-                            time.sleep(0.5)  # Reduced from 1
+                            # Scroll button into view; an instant scroll is clickable right away
+                            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clickable_button)
 
-                            # Try regular click first
-                            try:
-                                clickable_button.click()
-                                click_successful = True
-                                break
-                            except Exception:
-                                # Fallback to JavaScript click
-                                driver.execute_script("arguments[0].click();", clickable_button)
-                                click_successful = True
-                                break
+                            # The script already checked visibility, so click in-page directly
+                            driver.execute_script("arguments[0].click();", clickable_button)
+                            click_successful = True
+                            break
 
                         except Exception as e:
                             self.logger.warning(f"Click attempt {attempt + 1} failed: {e}")
@@ -437,11 +908,12 @@ class BaTScraper:
                         consecutive_fails += 1
                         continue
 
-                    # Wait longer for content to load (auction results can be slow)
-                    time.sleep(4)  # Reduced from 6
+                    # Wait for the next batch of cards to render (auction results can be slow)
+                    self.wait_for_listing_links(driver, more_than=pre_click_links, timeout=8)
 
                     # Collect new results from this page
                     new_urls_this_page = collect_results_page()
+                    yield from new_urls_this_page
                     post_click_count = len(listing_urls)
                     actual_new = post_click_count - pre_click_count
 
@@ -496,80 +968,155 @@ class BaTScraper:
 
             self.logger.info(f"Auction results search completed after {page_clicks} pages")
 
+        except WebDriverException as e:
+            # Don't hand a crashed browser on to the next phase
+            self.logger.error(f"Error searching auction results: {e}")
+            self.discard_discovery_driver()
+
         except Exception as e:
             self.logger.error(f"Error searching auction results: {e}")
 
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+    def search_auction_results_api(self) -> Iterator[str]:
+        """
+        Page through BaT's listings-filter JSON endpoint for Porsche 911 auctions, sold or not.
+        Falls back to Selenium pagination when the endpoint is unavailable on the first page.
+        """
+        api_url = f"{self.base_url}/wp-json/bringatrailer/1.0/data/listings-filter"
+        cutoff_ts = self.cutoff_date.timestamp()
+        listing_urls = set()
+        page = 1
+        max_pages = 100
+        pages_done = 0
+
+        while page <= max_pages and self.should_continue():
+            params = {
+                'page': page,
+                'per_page': 60,
+                'get_items': 1,
+                'get_stats': 0,
+                'sort': 'td',
+                'base_filter[keyword_s]': 'porsche 911',
+                'base_filter[items_type]': 'listing',
+            }
+            try:
+                self.rate_limiter.wait()
+                response = self.session.get(api_url, params=params, timeout=30)
+                response.raise_for_status()
+                items = orjson.loads(response.content).get('items')
+            except (requests.RequestException, ValueError, AttributeError) as e:
+                if page == 1:
+                    self.logger.info(f"Auction results API unavailable ({e}), falling back to browser pagination")
+                    yield from self.search_auction_results()
+                    return
+                self.logger.warning(f"Auction results API failed on page {page}: {e}")
+                break
 
-        return list(listing_urls)
+            if not isinstance(items, list):
+                if page == 1:
+                    self.logger.info("Auction results API returned no item list, falling back to browser pagination")
+                    yield from self.search_auction_results()
+                    return
+                break
+            # Skip malformed entries rather than letting one end discovery
+            items = [item for item in items if isinstance(item, dict)]
+            if not items:
+                break
+
+            old_count = 0
+            new_urls_this_page = []
+            for item in items:
+                ended = item.get('timestamp_end')
+                if isinstance(ended, (int, float)) and ended < cutoff_ts:
+                    old_count += 1
+                    continue
+                href = urljoin(self.base_url, item.get('url') or '')
+                if self.is_valid_listing_url(href) and href not in listing_urls:
+                    listing_urls.add(href)
+                    new_urls_this_page.append(href)
+
+            if page == 1 and not listing_urls and old_count < len(items):
+                self.logger.info("Auction results API items carry no listing URLs, falling back to browser pagination")
+                yield from self.search_auction_results()
+                return
+
+            self.logger.info(f"Auction results API page {page}: {len(items)} items ({old_count} older than cutoff), total: {len(listing_urls)}")
+            yield from new_urls_this_page
+            pages_done += 1
+
+            # Results are sorted by end date, so a page of only old auctions ends the window
+            if old_count == len(items):
+                break
+            page += 1
 
-    def search_porsche_911_listings(self) -> List[str]:
+        self.logger.info(f"Auction results API search completed after {pages_done} pages")
+
+    def search_porsche_911_listings(self) -> Iterator[str]:
         """
         Search for Porsche 911 listings from both the main page and auction results.
         This provides comprehensive coverage of active listings and recent sold listings.
+        Yields each unique URL as soon as it is discovered.
         """
         self.logger.info("Searching for Porsche 911 listings from multiple sources")
-        all_listing_urls = set()
+
+        # Keyed by listing id so query-string, fragment or trailing-slash variants of
+        # the same listing are only fetched once
+        all_listing_ids = set()
 
         # Method 1: Search the main Porsche 911 page for current/featured listings
         self.logger.info("Phase 1: Searching main Porsche 911 page")
-        main_page_urls = self._search_main_page()
-        all_listing_urls.update(main_page_urls)
-        self.logger.info(f"Main page found: {len(main_page_urls)} listings")
+        main_page_count = 0
+        for url in self._search_main_page():
+            main_page_count += 1
+            listing_id = self.listing_id_from_url(url)
+            if listing_id not in all_listing_ids:
+                all_listing_ids.add(listing_id)
+                yield url
+        self.logger.info(f"Main page found: {main_page_count} listings")
 
         # Method 2: Search auction results for comprehensive data
         self.logger.info("Phase 2: Searching auction results for recent data")
-        results_urls = self.search_auction_results()
-        all_listing_urls.update(results_urls)
-        self.logger.info(f"Auction results found: {len(results_urls)} listings")
-
-        unique_urls = list(all_listing_urls)
-        self.logger.info(f"Total unique listings found: {len(unique_urls)}")
-
-        return unique_urls
-
-    def _search_main_page(self) -> List[str]:
-        """Search the main Porsche 911 page for current listings."""
+        results_count = 0
+        for url in self.search_auction_results_api():
+            results_count += 1
+            listing_id = self.listing_id_from_url(url)
+            if listing_id not in all_listing_ids:
+                all_listing_ids.add(listing_id)
+                yield url
+        self.logger.info(f"Auction results found: {results_count} listings")
+
+        self.logger.info(f"Total unique listings found: {len(all_listing_ids)}")
+
+    def _search_main_page(self) -> Iterator[str]:
+        """Search the main Porsche 911 page for current listings, yielding each new URL."""
         listing_urls = set()
-        driver = None
+        seen_hrefs = set()
 
         try:
-            driver = self.configure_chrome_driver()
+            driver = self.discovery_driver()
 
             # Go to the Porsche 911 page
             porsche_url = f"{self.base_url}/porsche/911/"
             driver.get(porsche_url)
 
-            # Wait for page to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)  # Reduced from 5
+            # Wait for the listing grid rather than a fixed delay
+            self.wait_for_listing_links(driver, timeout=15)
 
             def collect_main_listings():
                 """Collect listings from main page."""
-                current_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/listing/"]')
-                new_urls_added = 0
+                new_urls_added = []
 
-                for link in current_links:
-                    try:
-                        href = link.get_attribute('href')
-                        if href and self.is_valid_listing_url(href):
-                            if href not in listing_urls:
-                                listing_urls.add(href)
-                                new_urls_added += 1
-                    except:
+                for href in driver.execute_script(_LISTING_HREFS_JS):
+                    if href in seen_hrefs:
                         continue
+                    seen_hrefs.add(href)
+                    if href and self.is_valid_listing_url(href):
+                        listing_urls.add(href)
+                        new_urls_added.append(href)
 
                 return new_urls_added
 
             # Initial collection
-            collect_main_listings()
+            yield from collect_main_listings()
 
             # Try clicking Show More buttons on main page
             show_more_clicks = 0
@@ -577,49 +1124,44 @@ class BaTScraper:
 
             while show_more_clicks < max_clicks and self.should_continue():
                 try:
-                    show_more_buttons = driver.find_elements(
-                        By.XPATH,
-                        "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]"
-                    )
-
-                    clickable_button = next(
-                        (b for b in show_more_buttons if b.is_displayed() and b.is_enabled()),
-                        None
-                    )
+                    found = self.find_show_more_button(driver, (_SHOW_MORE_XPATH,))
+                    clickable_button = found[0] if found else None
 
                     if not clickable_button:
                         break
 
+                    pre_click_links = len(driver.find_elements(By.CSS_SELECTOR, _LISTING_LINK_CSS))
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", clickable_button)
-                    time.sleep(0.5)  # Reduced from 1
 
                     try:
                         clickable_button.click()
                     except:
                         driver.execute_script("arguments[0].click();", clickable_button)
 
-                    time.sleep(2)  # Reduced from 4
+                    self.wait_for_listing_links(driver, more_than=pre_click_links, timeout=8)
 
                     new_listings = collect_main_listings()
-                    if new_listings == 0:
+                    if not new_listings:
                         break
+                    yield from new_listings
 
                     show_more_clicks += 1
 
                 except Exception:
                     break
 
-        except Exception as e:
+        except WebDriverException as e:
+            # Don't hand a crashed browser on to the next phase
             self.logger.error(f"Error searching main page: {e}")
+            self.discard_discovery_driver()
 
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+        except Exception as e:
+            self.logger.error(f"Error searching main page: {e}")
 
-        return list(listing_urls)
+    def listing_id_from_url(self, url: str) -> str:
+        """Return the listing slug from a /listing/<id>/ URL."""
+        url_parts = urlparse(url).path.split('/')
+        return url_parts[2] if len(url_parts) > 2 else ''
 
     def is_valid_listing_url(self, url: str) -> bool:
         """
@@ -629,6 +1171,11 @@ class BaTScraper:
         if not url or '/listing/' not in url:
             return False
 
+        # Most listing links on a results page are other makes and models; reject
+        # them on a substring check before parsing the URL
+        if '-porsche-911-' not in url.lower():
+            return False
+
         try:
             parsed = urlparse(url)
             path_parts = [p for p in parsed.path.split('/') if p]
@@ -636,19 +1183,8 @@ class BaTScraper:
             if len(path_parts) >= 2 and path_parts[0] == 'listing':
                 listing_name = path_parts[1]
 
-                # STRICT PATTERN: Must be YYYY-porsche-911-*
-                pattern = r'^(19[8-9]\d|20[0-2]\d)-porsche-911-'
-                if not re.match(pattern, listing_name, re.IGNORECASE):
-                    return False
-
-                # Extract and validate year
-                year_match = re.match(r'^(\d{4})', listing_name)
-                if year_match:
-                    year = int(year_match.group(1))
-                    if year < 1981:
-                        return False
-
-                return True
+                # STRICT PATTERN: Must be YYYY-porsche-911-* with a 1981+ year
+                return bool(_LISTING_PATH_RE.match(listing_name))
 
         except Exception:
             return False
@@ -657,20 +1193,34 @@ class BaTScraper:
 
     def extract_vin_from_text(self, text: str) -> Optional[str]:
         """Extract 17-digit VIN starting with WP0 from text content."""
-        # Pattern for 17-digit VIN
-        vin_pattern = r'\b[A-HJ-NPR-Z0-9]{17}\b'
-        matches = re.findall(vin_pattern, text, re.IGNORECASE)
+        text_upper = text.upper()
+        if len(text_upper) != len(text):
+            # A few non-ASCII characters grow when uppercased; offsets no longer line up
+            for match in _WP0_VIN_RE.finditer(text):
+                vin = match.group().upper()
+                if _is_valid_vin(vin):
+                    return vin
+            return None
 
-        for match in matches:
-            vin = match.upper()
-            # Only accept Porsche VINs starting with WP0
-            if vin.startswith('WP0') and validate_vin(vin):
-                return vin
+        # Only Porsche VINs starting with WP0 are accepted, so jump between literal
+        # WP0 hits and check the 17 characters there form a whole word
+        text_len = len(text_upper)
+        start = text_upper.find('WP0')
+        while start >= 0:
+            end = start + 17
+            if (end <= text_len
+                    and (start == 0 or not _is_word_char(text_upper[start - 1]))
+                    and (end == text_len or not _is_word_char(text_upper[end]))
+                    and _VIN_CHARS_RE.fullmatch(text_upper, start, end)):
+                vin = text_upper[start:end]
+                if _is_valid_vin(vin):
+                    return vin
+            start = text_upper.find('WP0', start + 1)
 
         return None
 
-    def extract_price_from_text(self, text: str) -> Dict[str, Any]:
-        """Extract price information from text."""
+    def extract_price_from_text(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Extract price information from text (pass text_lower to reuse a lowercased copy)."""
         price_info = {
             'current_bid': '',
             'reserve_met': False,
@@ -679,226 +1229,111 @@ class BaTScraper:
             'no_reserve': False
         }
 
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
 
         # Current bid patterns
-        bid_patterns = [
-            r'usd\s*\$[\d,]+',  # "USD $149,582"
-            r'bid:\s*usd\s*\$[\d,]+',
-            r'current bid[:\s]*\$[\d,]+',
-            r'\$[\d,]+\s*current bid',
-            r'bid[:\s]*\$[\d,]+',
-        ]
-
-        for pattern in bid_patterns:
-            match = re.search(pattern, text_lower)
+        for bid_re in _BID_RES:
+            match = bid_re.search(text_lower)
             if match:
-                price_match = re.search(r'\$[\d,]+', match.group())
+                price_match = _PRICE_RE.search(match.group())
                 if price_match:
                     price_info['current_bid'] = price_match.group()
                     break
 
         # Reserve status
-        if 'reserve met' in text_lower or 'reserve has been met' in text_lower:
+        if any(indicator in text_lower for indicator in _RESERVE_MET_INDICATORS):
             price_info['reserve_met'] = True
 
-        if 'no reserve' in text_lower or 'no-reserve' in text_lower:
+        if any(indicator in text_lower for indicator in _NO_RESERVE_INDICATORS):
             price_info['no_reserve'] = True
 
         # Sold price (for auction results)
-        sold_patterns = [
-            r'sold for \$[\d,]+',
-            r'winning bid[:\s]*\$[\d,]+',
-            r'final bid[:\s]*\$[\d,]+',
-            r'hammer price[:\s]*\$[\d,]+',
-        ]
-
-        for pattern in sold_patterns:
-            match = re.search(pattern, text_lower)
+        for sold_re in _SOLD_RES:
+            match = sold_re.search(text_lower)
             if match:
-                price_match = re.search(r'\$[\d,]+', match.group())
+                price_match = _PRICE_RE.search(match.group())
                 if price_match:
                     price_info['sold_price'] = price_match.group()
                     break
 
         return price_info
 
-    def determine_auction_status(self, page_text: str) -> str:
+    def determine_auction_status(self, page_text: str, text_lower: Optional[str] = None) -> str:
         """Determine if this is an active auction, sold auction, or ended without sale."""
-        text_lower = page_text.lower()
-
-        # Check for SOLD indicators FIRST (highest priority)
-        sold_indicators = [
-            'sold for usd $',  # "Sold for USD $56,000 on 9/25/24"
-            'sold for $',
-            'bid to usd $',    # "Bid to USD $211,500 on 9/1/25" (indicates completed auction)
-            'winning bid:',
-            'final bid:',
-            'hammer price:',
-            'sale completed',
-            'congratulations to',
-            'auction ended',   # This should come before active checks
-            'sold on ',        # "sold on 10/30/2024"
-            'ended on ',       # "ended on 10/30/2024"
-        ]
-
-        for indicator in sold_indicators:
-            if indicator in text_lower:
-                return 'sold'
-
-        # Check for ended without sale indicators SECOND
-        ended_indicators = [
-            'reserve not met',
-            'auction ended without sale',
-            'no sale',
-            'did not meet reserve',
-            'reserve was not met',
-            'unsuccessful auction'
-        ]
-
-        for indicator in ended_indicators:
-            if indicator in text_lower:
-                return 'ended'
-
-        # Check for ACTIVE indicators LAST (only if not sold/ended)
-        active_indicators = [
-            'current bid: usd $',  # "Current Bid: USD $48,755" (active auction)
-            'ends in',             # "Ends in"
-            'time left:',
-            'days left',
-            'hours left',
-            'minutes left',
-            'bidding ends',
-            'checking for last second bids',
-            'place bid',
-            'register to bid',
-            'bid now',
-            'reserve not yet met'  # This indicates active auction
-        ]
-
-        for indicator in active_indicators:
-            if indicator in text_lower:
-                return 'active'
+        if text_lower is None:
+            text_lower = page_text.lower()
+
+        # Check for SOLD indicators FIRST (highest priority), then ended, then active.
+        # Plain `in` checks use CPython's fast substring search; a single regex
+        # alternation over all indicators measured several times slower.
+        if any(indicator in text_lower for indicator in _SOLD_INDICATORS):
+            return 'sold'
+
+        if any(indicator in text_lower for indicator in _ENDED_INDICATORS):
+            return 'ended'
+
+        if any(indicator in text_lower for indicator in _ACTIVE_INDICATORS):
+            return 'active'
 
         # If we can't determine from indicators, check patterns with dates
-        import re
-        
-        # Look for patterns that indicate sold vs active
-        sold_date_patterns = [
-            r'sold for usd \$[\d,]+ on \d{1,2}/\d{1,2}/\d{2,4}',     # "Sold for USD $56,000 on 9/25/24"
-            r'bid to usd \$[\d,]+ on \d{1,2}/\d{1,2}/\d{2,4}',      # "Bid to USD $211,500 on 9/1/25"
-            r'ended \d{1,2}/\d{1,2}/\d{2,4}',
-            r'sold on \d{1,2}/\d{1,2}/\d{2,4}',
-        ]
-        
-        active_patterns = [
-            r'current bid:\s*usd \$[\d,]+',  # "Current Bid: USD $48,755"
-        ]
-        
-        # Check sold patterns first
-        for pattern in sold_date_patterns:
-            if re.search(pattern, text_lower):
-                return 'sold'
-                
-        # Then check active patterns
-        for pattern in active_patterns:
-            if re.search(pattern, text_lower):
-                return 'active'
-        
+        if any(sold_re.search(text_lower) for sold_re in _SOLD_DATE_RES):
+            return 'sold'
+
+        if _ACTIVE_BID_RE.search(text_lower):
+            return 'active'
+
         # Default to unknown if we can't determine
         return 'unknown'
 
-    def extract_clean_description(self, soup: BeautifulSoup) -> str:
+    def extract_section_text(self, tree: lxml.html.HtmlElement, xpath: etree.XPath) -> str:
+        """Join the text of every element matching a compiled XPath."""
+        return ' '.join(_element_text(element, ' ') for element in xpath(tree))
+
+    def extract_clean_description(self, tree: lxml.html.HtmlElement) -> str:
         """Extract clean description, avoiding error messages and navigation text."""
         description = ""
-        
+
         # Try multiple approaches to get clean description
-        approaches = [
-            # Approach 1: Look for specific BaT description containers
-            {
-                'selectors': ['div[class*="listing-description"]', 'div[class*="auction-description"]', 'div[class*="description"]'],
-                'min_length': 50
-            },
-            # Approach 2: Look for paragraphs with meaningful content
-            {
-                'selectors': ['div.listing-content p', 'div.auction-content p', 'main p'],
-                'min_length': 30
-            },
-            # Approach 3: Look for text blocks that contain car-specific keywords
-            {
-                'selectors': ['div', 'section', 'article'],
-                'min_length': 100,
-                'must_contain': ['powered by', 'engine', 'transmission', 'miles', 'purchased', 'equipped', 'features']
-            }
-        ]
-        
-        # Skip patterns that indicate error messages or navigation
-        skip_patterns = [
-            r'please address the errors below',
-            r'view all listings',
-            r'notify me about new listings', 
-            r'get this.*delivered with bring a trailer',
-            r'transparent pricing',
-            r'real time tracking',
-            r'easy and secure',
-            r'learn more',
-            r'sign in',
-            r'register',
-            r'search',
-            r'filter',
-            r'sort by',
-            r'show more',
-            r'load more',
-        ]
-        
-        for approach in approaches:
-            for selector in approach['selectors']:
+        for xpaths, min_length, must_contain in _DESCRIPTION_APPROACHES:
+            for xpath in xpaths:
                 try:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        text = element.get_text(strip=True)
-                        
-                        if len(text) < approach['min_length']:
+                    for element in xpath(tree):
+                        text = _element_text(element)
+
+                        if len(text) < min_length:
                             continue
-                            
+
                         # Skip if it matches error/navigation patterns
                         text_lower = text.lower()
-                        if any(re.search(pattern, text_lower) for pattern in skip_patterns):
+                        if any(pattern.search(text_lower) for pattern in _DESCRIPTION_SKIP_RES):
                             continue
-                            
+
                         # For approach 3, check if it contains car-specific keywords
-                        if 'must_contain' in approach:
-                            if not any(keyword in text_lower for keyword in approach['must_contain']):
-                                continue
-                        
+                        if must_contain and not any(keyword in text_lower for keyword in must_contain):
+                            continue
+
                         # Take the first valid description found
                         description = text[:1000]  # Limit length
                         break
-                        
+
                     if description:
                         break
                 except Exception as e:
                     continue
-                        
+
                 if description:
                     break
-        
+
         return description
 
-    def extract_clean_location(self, soup: BeautifulSoup, page_text: str) -> str:
+    def extract_clean_location(self, tree: lxml.html.HtmlElement, page_text: str) -> str:
         """Extract clean location, avoiding description text."""
         location = ""
         
-        # Location-specific patterns in text
-        location_patterns = [
-            r'located in ([^,\n.]+(?:,\s*[A-Z]{2})?)',  # "Located in City, ST" 
-            r'seller[:\s]+[^,\n]+[,\s]+([^,\n.]+(?:,\s*[A-Z]{2})?)',  # "Seller: Name, Location"
-            r'(?:from|in)\s+([A-Z][a-z]+(?:,\s*[A-Z]{2})?)',  # "from/in Location"
-        ]
-        
         # Try to extract location from page text using patterns
-        for pattern in location_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in _LOCATION_RES:
+            match = pattern.search(page_text)
             if match:
                 potential_location = match.group(1).strip()
                 
@@ -910,18 +1345,11 @@ class BaTScraper:
         
         # If no location found, try specific selectors
         if not location:
-            location_selectors = [
-                'span[class*="location"]',
-                'div[class*="location"]',
-                'span[class*="seller"]',
-                'div[class*="seller"]'
-            ]
-            
-            for selector in location_selectors:
+            for xpath in _LOCATION_XPATHS:
                 try:
-                    element = soup.select_one(selector)
-                    if element:
-                        text = element.get_text(strip=True)
+                    elements = xpath(tree)
+                    if elements:
+                        text = _element_text(elements[0])
                         if len(text) < 100 and text:  # Reasonable location length
                             location = text
                             break
@@ -930,30 +1358,60 @@ class BaTScraper:
         
         return location
 
+    def fetch_listing_html(self, listing_url: str) -> Optional[bytes]:
+        """
+        Fetch a listing page over HTTP; None when BaT blocks or challenges the request.
+        Other failures raise requests.RequestException: the browser would only repeat them.
+        """
+        try:
+            self.rate_limiter.wait()
+            response = self.session.get(listing_url, timeout=20)
+        except requests.exceptions.RetryError:
+            # The adapter's 429/5xx retries ran out; give the site room before the next listing
+            self.rate_limiter.slow_down()
+            self.logger.info(f"Throttled by BaT, request interval now {self.rate_limiter.interval:.1f}s")
+            raise
+
+        if response.status_code == 403 or any(marker in response.content for marker in _CHALLENGE_MARKERS):
+            self.logger.info(f"HTTP fetch challenged ({response.status_code}), falling back to browser for {listing_url}")
+            return None
+
+        response.raise_for_status()
+        self.rate_limiter.speed_up()
+        return response.content
+
+    def fetch_listing_html_with_browser(self, listing_url: str) -> str:
+        """Render a listing page in this worker's Chrome session."""
+        driver = self.worker_driver()
+        self.rate_limiter.wait()
+        driver.get(listing_url)
+
+        # Wait for the listing title instead of a fixed delay; parse whatever loaded on timeout
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+        except TimeoutException:
+            self.logger.debug(f"Timed out waiting for listing title: {listing_url}")
+
+        return driver.page_source
+
     def scrape_listing_details(self, listing_url: str) -> Optional[Dict[str, Any]]:
         """Scrape detailed information from a BaT listing with improved description/location extraction."""
         # Check if we need to stop before starting each listing
         # This will be checked in the main loop with scraped count
 
         self.logger.info(f"Scraping listing: {listing_url}")
-        driver = None
 
         try:
-            driver = self.configure_chrome_driver()
-            driver.get(listing_url)
-
-            # Wait for page to load
-            wait = WebDriverWait(driver, 15)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Listing pages are server-rendered; only use the browser when plain HTTP is refused
+            page_source = self.fetch_listing_html(listing_url)
+            if page_source is None:
+                page_source = self.fetch_listing_html_with_browser(listing_url)
 
-            # Give page time to fully load
-            time.sleep(1.5)  # Reduced from 3
-
-            # Get page source and parse
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            # Parse page source
+            tree = _parse_html(page_source)
 
             # Get page text for analysis
-            page_text = soup.get_text(separator=' ', strip=True)
+            page_text = _element_text(tree, ' ')
             page_text_lower = page_text.lower()
 
             # Verify this is actually a Porsche 911 listing
@@ -961,24 +1419,40 @@ class BaTScraper:
                 self.logger.info(f"Not a Porsche 911 listing, skipping: {listing_url}")
                 return None
 
+            # The essentials list and auction summary are a small slice of the page; scan
+            # those first and only fall back to the full page text when they miss
+            essentials_text = self.extract_section_text(tree, _ESSENTIALS_XPATH)
+            summary_text = self.extract_section_text(tree, _AUCTION_SUMMARY_XPATH)
+            summary_lower = summary_text.lower()
+
             # Determine auction status first
-            auction_status = self.determine_auction_status(page_text)
+            auction_status = self.determine_auction_status(summary_text, summary_lower)
+            if auction_status == 'unknown':
+                auction_status = self.determine_auction_status(page_text, page_text_lower)
+
+            # Extract the auction end date once; it drives both the age check and end_date.
+            # The summary carries the result line ("Sold for USD $X on 9/18/25"), so body
+            # copy and comments are only scanned when it has no date
+            end_date = (self.extract_auction_end_date(summary_text, listing_url, summary_lower) or
+                        self.extract_auction_end_date(page_text, listing_url, page_text_lower))
 
             # Check if this listing is too old (skip if it is)
-            if self.is_listing_too_old(page_text, listing_url, auction_status):
+            if self.is_auction_date_too_old(end_date, listing_url, auction_status):
                 return None
 
             # CRITICAL: Extract VIN and verify it's a WP0 VIN
-            vin = self.extract_vin_from_text(page_text)
+            vin = self.extract_vin_from_text(essentials_text) or self.extract_vin_from_text(page_text)
             if not vin:
                 self.logger.info(f"No valid WP0 VIN found, skipping: {listing_url}")
                 return None
 
-            if vin in self.processed_vins:
-                self.logger.info(f"VIN {vin} already processed, skipping")
-                return None
+            # Check-and-add under the lock so concurrent workers can't both claim a VIN
+            with self._vins_lock:
+                if vin in self.processed_vins:
+                    self.logger.info(f"VIN {vin} already processed, skipping")
+                    return None
 
-            self.processed_vins.add(vin)
+                self.processed_vins.add(vin)
 
             # Extract basic listing info
             listing_data = {
@@ -1007,131 +1481,113 @@ class BaTScraper:
             }
 
             # Extract listing ID from URL
-            url_parts = urlparse(listing_url).path.split('/')
-            if len(url_parts) > 2:
-                listing_data['listing_id'] = url_parts[2]
+            listing_data['listing_id'] = self.listing_id_from_url(listing_url)
 
-            # Extract auction end date
-            end_date = self.extract_auction_end_date(page_text, listing_url)
+            # Auction end date
             if end_date:
                 listing_data['end_date'] = end_date.strftime('%Y-%m-%d')
 
             # Title and basic info
-            title_selectors = ['h1', '.listing-title', '.auction-title', 'title']
-            for selector in title_selectors:
-                title_elem = soup.find(selector)
-                if title_elem:
-                    title_text = title_elem.get_text(strip=True)
+            for tag in ('h1', 'title'):
+                title_elem = tree.find(f'.//{tag}')
+                if title_elem is not None:
+                    title_text = _element_text(title_elem)
                     if title_text and len(title_text) > 5:  # Valid title
                         listing_data['title'] = title_text
                         # Extract year from title
-                        year_match = re.search(r'\b(19|20)\d{2}\b', title_text)
+                        year_match = _TITLE_YEAR_RE.search(title_text)
                         if year_match:
                             listing_data['year'] = year_match.group()
                         break
 
             # Price information
-            listing_data['price_info'] = self.extract_price_from_text(page_text)
+            price_info = self.extract_price_from_text(summary_text, summary_lower)
+            if not (price_info['current_bid'] or price_info['sold_price']):
+                price_info = self.extract_price_from_text(page_text, page_text_lower)
+            listing_data['price_info'] = price_info
 
             # Extract full details for comprehensive data collection
             # Mileage
-            mileage_patterns = [
-                r'(\d{1,3}(?:,\d{3})*)\s*(?:mile|mi\b)',
-                r'showing\s*(\d{1,3}(?:,\d{3})*)',
-                r'odometer[:\s]+(\d{1,3}(?:,\d{3})*)',
-            ]
-
-            for pattern in mileage_patterns:
-                match = re.search(pattern, page_text.lower())
+            for pattern in _MILEAGE_RES:
+                match = pattern.search(page_text_lower)
                 if match:
                     listing_data['mileage'] = match.group(1)
                     break
 
             # FIXED: Clean location extraction
-            listing_data['location'] = self.extract_clean_location(soup, page_text)
+            listing_data['location'] = self.extract_clean_location(tree, page_text)
 
             # Specifications
-            specs_text = page_text.lower()
+            specs_text = page_text_lower
 
             # Engine
-            engine_patterns = [
-                r'(\d\.\d)\s*(?:l|liter)',
-                r'(\d,?\d{3})\s*cc',
-            ]
-
-            for pattern in engine_patterns:
-                match = re.search(pattern, specs_text)
+            for pattern in _ENGINE_RES:
+                match = pattern.search(specs_text)
                 if match:
                     listing_data['specifications']['engine'] = match.group(1)
                     break
 
             # Transmission
-            if any(word in specs_text for word in ['manual', 'stick', '5-speed', '6-speed']):
+            if any(word in specs_text for word in _MANUAL_KEYWORDS):
                 listing_data['specifications']['transmission'] = 'Manual'
-            elif any(word in specs_text for word in ['automatic', 'tiptronic', 'pdk']):
+            elif any(word in specs_text for word in _AUTOMATIC_KEYWORDS):
                 listing_data['specifications']['transmission'] = 'Automatic'
 
             # Drive type
-            if any(word in specs_text for word in ['carrera 4', 'c4', 'awd', 'all-wheel']):
+            if any(word in specs_text for word in _AWD_KEYWORDS):
                 listing_data['specifications']['drive_type'] = 'AWD'
             else:
                 listing_data['specifications']['drive_type'] = 'RWD'
 
             # Features
-            features = []
-            feature_keywords = [
-                'sport chrono', 'pasm', 'pdls', 'pccb', 'sport exhaust',
-                'sunroof', 'navigation', 'heated seats', 'air conditioning',
-                'leather', 'alcantara', 'bose', 'xenon', 'led'
-            ]
-
-            for keyword in feature_keywords:
-                if keyword in specs_text:
-                    features.append(keyword.title())
-
-            listing_data['features'] = features
+            listing_data['features'] = [label for keyword, label, keyword_re in _FEATURE_KEYWORDS
+                                        if keyword in specs_text and keyword_re.search(specs_text)]
 
             # FIXED: Clean description extraction
-            listing_data['description'] = self.extract_clean_description(soup)
+            listing_data['description'] = self.extract_clean_description(tree)
 
-            # Photos
-            img_tags = soup.find_all('img')
+            # Photos - walk the images lazily and stop once 20 listing photos are found
             photo_urls = []
-
-            for img in img_tags:
-                src = img.get('src') or img.get('data-src')
+            for element in tree.iter('img'):
+                src = element.get('src') or element.get('data-src')
                 if src and ('bringatrailer' in src or src.startswith('/')):
                     if src.startswith('/'):
                         src = urljoin(self.base_url, src)
                     photo_urls.append(src)
+                    if len(photo_urls) == 20:
+                        break
 
-            listing_data['photos'] = photo_urls[:20]
+            listing_data['photos'] = photo_urls
 
             self.logger.info(f"Successfully scraped listing for VIN {vin} (Status: {listing_data['auction_status']}) {listing_data.get('end_date', '')}")
 
             return listing_data
 
+        except WebDriverException as e:
+            # A crashed or hung browser would fail every later listing on this worker
+            self.logger.error(f"Browser error scraping listing {listing_url}: {e}")
+            self.discard_worker_driver()
+            return None
+
+        except requests.RequestException as e:
+            self.logger.warning(f"HTTP fetch failed, skipping listing {listing_url}: {e}")
+            return None
+
         except Exception as e:
             self.logger.error(f"Error scraping listing {listing_url}: {e}")
             return None
 
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
-
     def normalize_bat_record(self, listing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize BaT listing data to match inventory schema."""
         # Extract year as integer
-        year = 0
-        if listing_data.get('year') and listing_data['year'].isdigit():
-            year = int(listing_data['year'])
+        year_text = listing_data.get('year') or ''
+        year = int(year_text) if year_text.isdigit() else 0
+
+        # Calculate age against the year the run started
+        age = self.start_time.year - year if year > 0 else 0
 
-        # Calculate age
-        current_year = datetime.now().year
-        age = current_year - year if year > 0 else 0
+        specs = listing_data.get('specifications') or {}
+        price_info = listing_data.get('price_info') or {}
 
         normalized = {
             # Primary identifiers
@@ -1146,8 +1602,8 @@ class BaTScraper:
             'doors': '2',
             'fuel_type': 'Gasoline',
             'engine_cylinders': '6',
-            'displacement_l': listing_data.get('specifications', {}).get('engine', ''),
-            'drive_type': listing_data.get('specifications', {}).get('drive_type', ''),
+            'displacement_l': specs.get('engine', ''),
+            'drive_type': specs.get('drive_type', ''),
 
             # BaT specific data
             'bat_listing_id': listing_data.get('listing_id', ''),
@@ -1162,15 +1618,16 @@ class BaTScraper:
             'bat_photo_count': len(listing_data.get('photos', [])),
 
             # Price information
-            'bat_current_bid': listing_data.get('price_info', {}).get('current_bid', ''),
-            'bat_reserve_met': listing_data.get('price_info', {}).get('reserve_met', False),
-            'bat_no_reserve': listing_data.get('price_info', {}).get('no_reserve', False),
-            'bat_sold_price': listing_data.get('price_info', {}).get('sold_price', ''),
+            'bat_current_bid': price_info.get('current_bid', ''),
+            'bat_reserve_met': price_info.get('reserve_met', False),
+            'bat_no_reserve': price_info.get('no_reserve', False),
+            'bat_sold_price': price_info.get('sold_price', ''),
 
             # Metadata
             'source': 'BringATrailer',
             'first_scraped': listing_data.get('scraped_at', ''),
-            'last_updated': create_timestamp(),
+            # Records are normalized as soon as they're scraped, so that timestamp is current
+            'last_updated': listing_data.get('scraped_at') or create_timestamp(),
             'scrape_count': 1,
 
             # Age classification
@@ -1182,10 +1639,17 @@ class BaTScraper:
         return normalized
 
 
-def scrape_bat_listings(max_runtime_minutes: int = 45, max_listings: Optional[int] = None) -> Dict[str, Any]:
-    """Scrape BaT for Porsche 911 listings with optional max listings limit."""
+def scrape_bat_listings(max_runtime_minutes: int = 45, max_listings: Optional[int] = None,
+                        max_workers: int = 4, cache_path: Optional[str] = 'bat_cache.sqlite',
+                        records_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Scrape BaT for Porsche 911 listings with optional max listings limit.
+    With records_path, normalized records are appended there as JSON Lines as they
+    arrive instead of being collected in results['listings']. Records already in that
+    file from an interrupted run are kept, and their listings are not scraped again.
+    """
     logger = setup_logging()
-    scraper = BaTScraper(max_runtime_minutes, max_listings)
+    scraper = BaTScraper(max_runtime_minutes, max_listings, cache_path=cache_path, max_workers=max_workers)
 
     # Results storage
     results = {
@@ -1199,6 +1663,10 @@ def scrape_bat_listings(max_runtime_minutes: int = 45, max_listings: Optional[in
             'new_vins': 0,
             'updated_vins': 0,
             'skipped_old_listings': 0,
+            'skipped_cached_listings': 0,
+            'resumed_listings': 0,
+            'status_counts': {},
+            'model_year_range': None,
             'cutoff_date': scraper.cutoff_date.strftime('%Y-%m-%d'),
             'max_listings_limit': max_listings,
             'source': 'BringATrailer',
@@ -1207,77 +1675,185 @@ def scrape_bat_listings(max_runtime_minutes: int = 45, max_listings: Optional[in
         'listings': []
     }
 
+    listings_found = 0
+    skipped_cached = 0
+    scraped_count = 0
+    vins_found = 0
+    skipped_old = 0
+    completed = 0
+    status_counts = Counter()
+    model_years = set()
+
+    def tally(record: Dict[str, Any]) -> None:
+        # Summary stats are kept as running counts so records needn't stay in memory
+        status_counts[record.get('bat_auction_status')] += 1
+        model_year = record.get('model_year', '')
+        if model_year.isdigit():
+            model_years.add(int(model_year))
+
+    # Pick up where an interrupted run left off
+    resumed_ids = set()
+    records_file = None
+    if records_path:
+        torn = False
+        if os.path.exists(records_path):
+            with open(records_path, 'rb') as existing:
+                for record in iter_json_records(existing):
+                    tally(record)
+                    scraped_count += 1
+                    if record.get('vin'):
+                        vins_found += 1
+                        scraper.processed_vins.add(record['vin'])
+                    if record.get('bat_listing_id'):
+                        resumed_ids.add(record['bat_listing_id'])
+                if existing.tell():
+                    existing.seek(-1, os.SEEK_END)
+                    torn = existing.read(1) != b'\n'
+            if scraped_count:
+                logger.info(f"Resuming with {scraped_count} listings already in {records_path}")
+                print(f"♻️ Resuming with {scraped_count} listings from a previous run")
+
+        records_file = open(records_path, 'ab')
+        if torn:
+            # Keep the next record off the line the interruption cut short
+            records_file.write(b'\n')
+    resumed = scraped_count
+
     # Performance tracking variables
     scraping_start_time = None
     last_report_count = 0
     report_interval = 10
 
     try:
-        # Search for listings using comprehensive approach
-        listing_urls = scraper.search_porsche_911_listings()
-        results['metadata']['total_listings_found'] = len(listing_urls)
-
-        # If we have a max_listings limit, truncate the URL list for efficiency
-        if max_listings and len(listing_urls) > max_listings:
-            listing_urls = listing_urls[:max_listings * 2]  # Get 2x to account for skips
-            logger.info(f"Truncated listing URLs to {len(listing_urls)} for testing (2x max_listings to account for skips)")
-
         # Start performance tracking for scraping phase
         scraping_start_time = datetime.now()
-        print(f"🚀 Starting detailed scraping of {len(listing_urls)} listings...")
+        print(f"🚀 Discovering listings and scraping details with {max_workers} workers...")
         if max_listings:
             print(f"🎯 Limited to maximum of {max_listings} listings for testing")
 
-        # Scrape individual listings
-        scraped_count = 0
-        vins_found = 0
-        skipped_old = 0
+        # Finished auctions from a previous run are skipped as they are discovered
+        final_ids = scraper.cache.final_listing_ids() if scraper.cache else set()
 
-        for i, url in enumerate(listing_urls, 1):
-            if not scraper.should_continue(scraped_count):
-                if scraper.max_listings and scraped_count >= scraper.max_listings:
-                    logger.info(f"Max listings limit ({scraper.max_listings}) reached, stopping scrape")
-                    print(f"🎯 Max listings limit ({scraper.max_listings}) reached!")
-                else:
-                    logger.info("Time limit reached, stopping scrape")
-                    print("⏰ Time limit reached!")
-                break
+        # If we have a max_listings limit, only queue 2x to account for skips
+        max_submissions = max_listings * 2 if max_listings else None
 
-            listing_data = scraper.scrape_listing_details(url)
-            if listing_data:
-                scraped_count += 1
-                if listing_data.get('vin'):
-                    vins_found += 1
+        # Discovery runs in its own thread and hands URLs over as each page is collected;
+        # finished detail futures come back through the same queue
+        events = queue.Queue()
 
-                normalized_record = scraper.normalize_bat_record(listing_data)
-                results['listings'].append(normalized_record)
-                
-                # Check if we've hit the max listings limit after successfully scraping
-                if scraper.max_listings and scraped_count >= scraper.max_listings:
-                    logger.info(f"Max listings limit ({scraper.max_listings}) reached after scraping {scraped_count} listings")
-                    print(f"🎯 Max listings limit reached! Scraped {scraped_count} listings.")
+        def discover_listings():
+            try:
+                for url in scraper.search_porsche_911_listings():
+                    events.put(url)
+            except Exception as e:
+                logger.error(f"Listing discovery failed: {e}")
+            finally:
+                events.put(None)
+
+        discovery_thread = threading.Thread(target=discover_listings, name='bat-discovery', daemon=True)
+
+        futures = set()
+        discovery_done = False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            discovery_thread.start()
+
+            while not discovery_done or futures:
+                event = events.get()
+
+                if event is None:
+                    discovery_done = True
+                    logger.info(f"Discovery finished with {listings_found} listings found")
+                    continue
+
+                if isinstance(event, str):
+                    listings_found += 1
+                    listing_id = scraper.listing_id_from_url(event)
+                    if listing_id in resumed_ids:
+                        continue
+                    if listing_id in final_ids:
+                        skipped_cached += 1
+                        continue
+                    if max_submissions and completed + len(futures) >= max_submissions:
+                        continue
+
+                    future = executor.submit(scraper.scrape_listing_details, event)
+                    futures.add(future)
+                    future.add_done_callback(events.put)
+                    continue
+
+                futures.discard(event)
+                completed += 1
+
+                listing_data = event.result()
+                if listing_data:
+                    scraped_count += 1
+                    if listing_data.get('vin'):
+                        vins_found += 1
+
+                    normalized_record = scraper.normalize_bat_record(listing_data)
+                    if records_file:
+                        # Flushed per record so a killed run can resume from what's on disk
+                        records_file.write(orjson.dumps(normalized_record, option=orjson.OPT_NON_STR_KEYS) + b'\n')
+                        records_file.flush()
+                    else:
+                        results['listings'].append(normalized_record)
+                    tally(normalized_record)
+
+                    if scraper.cache and listing_data.get('listing_id'):
+                        scraper.cache.record(listing_data['listing_id'], listing_data.get('vin', ''),
+                                             listing_data.get('auction_status', ''),
+                                             listing_data.get('scraped_at', ''))
+                else:
+                    skipped_old += 1
+
+                # Progress reporting every 10 listings or when hitting the limit
+                if (completed - last_report_count >= report_interval or 
+                    (scraper.max_listings and scraped_count >= scraper.max_listings)):
+                    elapsed_minutes = (datetime.now() - scraping_start_time).total_seconds() / 60
+                    rate_per_minute = completed / elapsed_minutes if elapsed_minutes > 0 else 0
+                    queued = completed + len(futures)
+                    
+                    progress_msg = f"⚡ Progress: {completed}/{queued} listings ({completed/queued*100:.1f}%) | Rate: {rate_per_minute:.1f}/min"
+                    if discovery_done:
+                        eta_minutes = len(futures) / rate_per_minute if rate_per_minute > 0 else 0
+                        progress_msg += f" | ETA: {eta_minutes:.1f}min"
+                    else:
+                        progress_msg += f" | Discovering ({listings_found} found)"
+                    if scraper.max_listings:
+                        progress_msg += f" | Scraped: {scraped_count}/{scraper.max_listings}"
+                    print(progress_msg)
+                    logger.info(progress_msg)
+                    last_report_count = completed
+
+                if not scraper.should_continue(scraped_count):
+                    if scraper.max_listings and scraped_count >= scraper.max_listings:
+                        logger.info(f"Max listings limit ({scraper.max_listings}) reached after scraping {scraped_count} listings")
+                        print(f"🎯 Max listings limit reached! Scraped {scraped_count} listings.")
+                    else:
+                        logger.info("Time limit reached, stopping scrape")
+                        print("⏰ Time limit reached!")
+
+                    # Drop queued work; listings already in flight finish but are discarded
+                    scraper.stop_event.set()
+                    for pending in futures:
+                        pending.cancel()
                     break
-            else:
-                skipped_old += 1
-
-            # Progress reporting every 10 listings or when hitting the limit
-            if (i - last_report_count >= report_interval or 
-                (scraper.max_listings and scraped_count >= scraper.max_listings)):
-                elapsed_minutes = (datetime.now() - scraping_start_time).total_seconds() / 60
-                rate_per_minute = i / elapsed_minutes if elapsed_minutes > 0 else 0
-                remaining_listings = len(listing_urls) - i
-                eta_minutes = remaining_listings / rate_per_minute if rate_per_minute > 0 else 0
-                
-                progress_msg = f"⚡ Progress: {i}/{len(listing_urls)} listings ({i/len(listing_urls)*100:.1f}%) | Rate: {rate_per_minute:.1f}/min | ETA: {eta_minutes:.1f}min"
-                if scraper.max_listings:
-                    progress_msg += f" | Scraped: {scraped_count}/{scraper.max_listings}"
-                print(progress_msg)
-                logger.info(progress_msg)
-                last_report_count = i
 
-            # Small delay between listings
-            time.sleep(0.5)
+        # Let discovery wind down before its browser is closed
+        scraper.stop_event.set()
+        discovery_thread.join(timeout=60)
 
+        if skipped_cached:
+            logger.info(f"Skipped {skipped_cached} finished listings already in cache")
+            print(f"💾 Skipped {skipped_cached} finished listings already in cache")
+
+        results['metadata']['total_listings_found'] = listings_found
+        results['metadata']['status_counts'] = dict(status_counts)
+        if model_years:
+            results['metadata']['model_year_range'] = [min(model_years), max(model_years)]
+        results['metadata']['skipped_cached_listings'] = skipped_cached
+        results['metadata']['resumed_listings'] = resumed
         results['metadata']['total_listings_scraped'] = scraped_count
         results['metadata']['listings_with_vins'] = vins_found
         results['metadata']['new_vins'] = vins_found
@@ -1288,12 +1864,20 @@ def scrape_bat_listings(max_runtime_minutes: int = 45, max_listings: Optional[in
         results['metadata']['error'] = str(e)
 
     finally:
+        scraper.stop_event.set()
+        scraper.close()
+        if records_file:
+            records_file.close()
+
         # Calculate runtime
         end_time = datetime.now()
         runtime = (end_time - scraper.start_time).total_seconds() / 60
         results['metadata']['runtime_minutes'] = round(runtime, 2)
         results['metadata']['scrape_completed'] = create_timestamp()
 
+        if scraper.cache:
+            scraper.cache.close()
+
     return results
 
 def main():
@@ -1305,6 +1889,11 @@ def main():
                         help='Maximum number of listings to scrape (default: no limit)')
     parser.add_argument('--output', default='bat-porsche-911-listings.json',
                         help='Output filename')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Number of listings to scrape concurrently (default: 4)')
+    parser.add_argument('--cache', default='bat_cache.sqlite',
+                        help='SQLite cache of finished listings to skip on later runs '
+                             '(default: bat_cache.sqlite, empty string disables)')
 
     args = parser.parse_args()
     logger = setup_logging()
@@ -1316,11 +1905,14 @@ def main():
         else:
             logger.info(f"Starting full BaT scrape with {args.max_runtime} minute limit")
 
-        # Scrape listings
-        results = scrape_bat_listings(args.max_runtime, args.max_listings)
+        # Scrape listings, streaming records to a JSON-Lines file alongside the output
+        records_path = f"{args.output}.jsonl"
+        results = scrape_bat_listings(args.max_runtime, args.max_listings, args.workers, args.cache,
+                                      records_path)
 
         # Save results
-        save_json_file(results, args.output)
+        save_json_with_records(results['metadata'], records_path, args.output)
+        os.remove(records_path)
 
         # Print summary
         metadata = results['metadata']
@@ -1334,6 +1926,7 @@ def main():
         print(f"📊 Listings scraped: {metadata['total_listings_scraped']}")
         print(f"🚗 Valid WP0 VINs collected: {metadata['listings_with_vins']}")
         print(f"⏭️ Old listings skipped: {metadata.get('skipped_old_listings', 0)}")
+        print(f"💾 Cached finished listings skipped: {metadata.get('skipped_cached_listings', 0)}")
 
         # Performance summary
         if metadata['runtime_minutes'] > 0 and metadata['total_listings_scraped'] > 0:
@@ -1341,25 +1934,15 @@ def main():
             print(f"⚡ Overall scraping rate: {overall_rate:.1f} listings/minute")
 
         # Show status breakdown if we have data
-        if results['listings']:
-            active_count = sum(1 for listing in results['listings']
-                             if listing.get('bat_auction_status') == 'active')
-            sold_count = sum(1 for listing in results['listings']
-                           if listing.get('bat_auction_status') == 'sold')
-            ended_count = sum(1 for listing in results['listings']
-                            if listing.get('bat_auction_status') == 'ended')
-            unknown_count = sum(1 for listing in results['listings']
-                              if listing.get('bat_auction_status') == 'unknown')
-
-            print(f"📈 Active auctions: {active_count}")
-            print(f"✅ Recent sold auctions: {sold_count}")
-            print(f"⏹️ Ended auctions: {ended_count}")
-            print(f"❓ Unknown status: {unknown_count}")
-
-            years = [int(listing.get('model_year', '0')) for listing in results['listings']
-                    if listing.get('model_year', '').isdigit()]
-            if years:
-                print(f"📅 Year range: {min(years)}-{max(years)}")
+        if metadata['total_listings_scraped']:
+            status_counts = metadata['status_counts']
+            print(f"📈 Active auctions: {status_counts.get('active', 0)}")
+            print(f"✅ Recent sold auctions: {status_counts.get('sold', 0)}")
+            print(f"⏹️ Ended auctions: {status_counts.get('ended', 0)}")
+            print(f"❓ Unknown status: {status_counts.get('unknown', 0)}")
+
+            if metadata['model_year_range']:
+                print(f"📅 Year range: {metadata['model_year_range'][0]}-{metadata['model_year_range'][1]}")
 
         return 0
 
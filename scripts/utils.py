@@ -8,9 +8,16 @@ import os
 import re
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional
+import orjson
 import requests
 from jsonschema import validate, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# VIN character set: 17 characters, no I, O or Q
+_VIN_CHARS_RE = re.compile(r'^[A-HJ-NPR-Z0-9]{17}$')
 
 
 def setup_logging() -> logging.Logger:
@@ -25,7 +32,10 @@ def setup_logging() -> logging.Logger:
 
 def validate_vin(vin: str) -> bool:
     """
-    Validate VIN format and check digit.
+    Validate VIN format: 17 characters with no I, O or Q.
+
+    The check digit is not verified: European-market Porsches (WP0ZZZ...) carry no
+    check digit in position 9, and BaT lists plenty of them.
 
     Args:
         vin: Vehicle Identification Number
@@ -37,22 +47,39 @@ def validate_vin(vin: str) -> bool:
         return False
 
     # Check for invalid characters
-    if not re.match(r'^[A-HJ-NPR-Z0-9]{17}$', vin.upper()):
+    if not _VIN_CHARS_RE.match(vin.upper()):
         return False
 
     return True
 
 
-def make_api_request(url: str, params: Optional[Dict[str, Any]] = None, 
-                    retries: int = 3, delay: float = 3.0) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _api_session(retries: int, delay: float) -> requests.Session:
+    """Keep-alive session whose adapter retries transient failures with backoff."""
+    session = requests.Session()
+    retry = Retry(total=max(retries - 1, 0), backoff_factor=delay,
+                  status_forcelist=[429, 500, 502, 503, 504], allowed_methods=['GET'],
+                  respect_retry_after_header=True)
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def make_api_request(url: str, params: Optional[Dict[str, Any]] = None,
+                    retries: int = 3, delay: float = 3.0,
+                    rate_limit_sleep: float = 0.0) -> Dict[str, Any]:
     """
-    Make API request with retry logic and rate limiting.
+    Make API request with retry logic and optional rate limiting.
 
     Args:
         url: API endpoint URL
         params: Query parameters
-        retries: Number of retry attempts
-        delay: Delay between retries in seconds
+        retries: Number of attempts, including the first
+        delay: Backoff factor for retries (delay, 2 * delay, ...); a Retry-After
+            header from the server takes precedence
+        rate_limit_sleep: Seconds to sleep after a successful request, for callers
+            making many requests in a row
 
     Returns:
         dict: API response data
@@ -62,32 +89,27 @@ def make_api_request(url: str, params: Optional[Dict[str, Any]] = None,
     """
     logger = logging.getLogger(__name__)
 
-    for attempt in range(retries):
-        try:
-            logger.info(f"Making API request to {url} (attempt {attempt + 1})")
-
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"API request successful, received {len(data)} items")
+    try:
+        logger.info(f"Making API request to {url}")
 
-            # Rate limiting - respect NHTSA API
-            if delay > 0:
-                time.sleep(delay)
+        response = _api_session(retries, delay).get(url, params=params, timeout=30)
+        response.raise_for_status()
 
-            return data
+        data = response.json()
+        logger.info(f"API request successful, received {len(data)} items")
 
-        except requests.RequestException as e:
-            logger.warning(f"API request failed (attempt {attempt + 1}): {e}")
+        if rate_limit_sleep > 0:
+            time.sleep(rate_limit_sleep)
 
-            if attempt == retries - 1:
-                logger.error(f"All retry attempts failed for {url}")
-                raise
+        return data
 
-            time.sleep(delay * (attempt + 1))  # Exponential backoff
+    except requests.exceptions.RetryError as e:
+        logger.error(f"API request to {url} failed after {retries} attempts: {e}")
+        raise
 
-    raise requests.RequestException("All retry attempts failed")
+    except requests.RequestException as e:
+        logger.error(f"API request to {url} failed: {e}")
+        raise
 
 
 def save_json_file(data: Dict[str, Any], filename: str) -> None:
@@ -101,8 +123,8 @@ def save_json_file(data: Dict[str, Any], filename: str) -> None:
     logger = logging.getLogger(__name__)
 
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         logger.info(f"Successfully saved data to {filename}")
 
@@ -111,6 +133,68 @@ def save_json_file(data: Dict[str, Any], filename: str) -> None:
         raise
 
 
+def save_json_with_records(metadata: Dict[str, Any], records_path: str, filename: str,
+                           records_key: str = 'listings') -> None:
+    """
+    Save metadata plus records streamed from a JSON-Lines file, one record at a time.
+
+    Produces the same layout as save_json_file({'metadata': ..., records_key: [...]})
+    without holding the records in memory.
+
+    Args:
+        metadata: Metadata to write first
+        records_path: JSON-Lines file with one record per line
+        filename: Output filename
+        records_key: Key for the records list
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        with open(filename, 'wb') as out, open(records_path, 'rb') as records:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            metadata_json = orjson.dumps(metadata, option=options).replace(b'\n', b'\n  ')
+            out.write(b'{\n  "metadata": ' + metadata_json + b',\n  ' + orjson.dumps(records_key) + b': [')
+
+            count = 0
+            for record in iter_json_records(records):
+                record_json = orjson.dumps(record, option=options)
+                out.write(b',\n    ' if count else b'\n    ')
+                out.write(record_json.replace(b'\n', b'\n    '))
+                count += 1
+
+            out.write(b'\n  ]\n}' if count else b']\n}')
+
+        logger.info(f"Successfully saved {count} records to {filename}")
+
+    except Exception as e:
+        logger.error(f"Failed to save data to {filename}: {e}")
+        raise
+
+
+def iter_json_records(lines) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records from JSON-Lines content, skipping blank or unreadable lines.
+
+    A line cut short by an interrupted run is logged and skipped rather than
+    failing the whole file.
+
+    Args:
+        lines: Iterable of JSON-Lines lines, such as a file opened in 'rb' mode
+
+    Yields:
+        Decoded records
+    """
+    logger = logging.getLogger(__name__)
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Skipping unreadable JSON-Lines record: {line[:80]!r}")
+
+
 def load_json_file(filename: str) -> Dict[str, Any]:
     """
     Load data from JSON file.
@@ -124,8 +208,8 @@ def load_json_file(filename: str) -> Dict[str, Any]:
     logger = logging.getLogger(__name__)
 
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
 
         logger.info(f"Successfully loaded data from {filename}")
         return data
@@ -184,7 +268,7 @@ def extract_vin_components(vin: str) -> Dict[str, str]:
         'check_digit': vin[8], # Check digit
         'model_year': vin[9],  # Model year
         'plant_code': vin[10], # Plant code
-        'vis': vin[10:],      # Vehicle Identifier Section
+        'vis': vin[9:],       # Vehicle Identifier Section (positions 10-17)
         'serial': vin[11:]    # Serial number
     }
 